@@ -1,6 +1,5 @@
 import threading
 import time
-import random
 import logging
 from typing import List, Any
 
@@ -10,96 +9,171 @@ logger = logging.getLogger(__name__)
 
 class SharedQueue:
     # Thread-safe bounded queue with wait/notify mechanism
+    # Items live in a preallocated ring buffer whose capacity is rounded up to a
+    # power of two, so head/tail wrap with a mask and steady state allocates nothing
     def __init__(self, max_size: int = 10):
-        self.queue = []
+        capacity = 1 << (max_size - 1).bit_length()
+        self.buf = [None] * capacity
+        self.mask = capacity - 1
+        self.head = 0
+        self.tail = 0
+        self.count = 0
         self.max_size = max_size
         self.lock = threading.Lock()
-        self.not_empty = threading.Condition(self.lock)
-        self.not_full = threading.Condition(self.lock)
+        # Single condition shared by producers and consumers; waiters of both
+        # kinds re-check their own predicate, so state changes use notify_all
+        self.cond = threading.Condition(self.lock)
         self.closed = False
 
+    # Copy items into the slots after tail, wrapping at most once; caller must hold self.cond
+    def _push(self, items: List[Any]):
+        n = len(items)
+        first = min(n, len(self.buf) - self.tail)
+        self.buf[self.tail:self.tail + first] = items[:first]
+        self.buf[:n - first] = items[first:]
+        self.tail = (self.tail + n) & self.mask
+        self.count += n
+
+    # Take n items from head and clear their slots; caller must hold self.cond
+    def _pop(self, n: int) -> List[Any]:
+        first = min(n, len(self.buf) - self.head)
+        items = self.buf[self.head:self.head + first] + self.buf[:n - first]
+        self.buf[self.head:self.head + first] = [None] * first
+        self.buf[:n - first] = [None] * (n - first)
+        self.head = (self.head + n) & self.mask
+        self.count -= n
+        return items
+
     # Add item to queue, blocks if full
     def put(self, item: Any) -> bool:
-        with self.not_full:
-            while len(self.queue) >= self.max_size and not self.closed:
+        with self.cond:
+            while self.count >= self.max_size and not self.closed:
                 logger.debug(f"Queue full, waiting to put: {item}")
-                self.not_full.wait()
+                self.cond.wait()
             if self.closed:
                 logger.warning("Queue closed, cannot put item")
                 return False
-            self.queue.append(item)
-            self.not_empty.notify()
+            self.buf[self.tail] = item
+            self.tail = (self.tail + 1) & self.mask
+            self.count += 1
+            self.cond.notify_all()
             return True
 
+    # Add a batch of items under one lock hold, blocking while full; returns count added
+    def put_many(self, items: List[Any]) -> int:
+        added = 0
+        with self.cond:
+            while added < len(items):
+                while self.count >= self.max_size and not self.closed:
+                    logger.debug(f"Queue full, waiting to put {len(items) - added} items")
+                    self.cond.wait()
+                if self.closed:
+                    logger.warning("Queue closed, cannot put items")
+                    break
+                chunk = items[added:added + self.max_size - self.count]
+                self._push(chunk)
+                added += len(chunk)
+                self.cond.notify_all()
+        return added
+
+    # Wait until an item is available; returns False on timeout or when closed and empty
+    # Caller must hold self.cond
+    def _wait_for_item(self, timeout: float = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.count == 0 and not self.closed:
+            logger.debug("Queue empty, waiting for item")
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                logger.debug("Get timeout reached")
+                return False
+            self.cond.wait(remaining)
+        return self.count > 0
+
     # Remove and return item from queue, blocks if empty
     def get(self, timeout: float = None) -> Any:
-        with self.not_empty:
-            start_time = time.time()
-            while len(self.queue) == 0 and not self.closed:
-                logger.debug("Queue empty, waiting for item")
-                if timeout is not None:
-                    remaining = timeout - (time.time() - start_time)
-                    if remaining <= 0:
-                        logger.debug("Get timeout reached")
-                        return None
-                    self.not_empty.wait(timeout=remaining)
-                else:
-                    self.not_empty.wait()
-            if len(self.queue) == 0:
+        with self.cond:
+            if not self._wait_for_item(timeout):
                 return None
-            item = self.queue.pop(0)
-            self.not_full.notify()
+            item = self.buf[self.head]
+            self.buf[self.head] = None
+            self.head = (self.head + 1) & self.mask
+            self.count -= 1
+            self.cond.notify_all()
             return item
 
+    # Remove and return up to max_n items, blocks until at least one is available
+    # Returns an empty list on timeout or when closed and empty
+    def get_many(self, max_n: int, timeout: float = None) -> List[Any]:
+        with self.cond:
+            if not self._wait_for_item(timeout):
+                return []
+            items = self._pop(min(max_n, self.count))
+            self.cond.notify_all()
+            return items
+
     # Signal that no more items will be added
     def close(self):
-        with self.lock:
+        with self.cond:
             logger.info("Closing queue")
             self.closed = True
-            self.not_empty.notify_all()
-            self.not_full.notify_all()
+            self.cond.notify_all()
 
-    # Check if queue is empty
+    # Check if queue is empty (approximate, unsynchronized - may be stale on return)
     def is_empty(self) -> bool:
-        with self.lock:
-            return len(self.queue) == 0
+        return self.count == 0
 
-    # Get current queue size
+    # Get current queue size (approximate, unsynchronized - may be stale on return)
     def size(self) -> int:
-        with self.lock:
-            return len(self.queue)
+        return self.count
 
 
 class Producer(threading.Thread):
     # Producer thread that reads from source and puts items into shared queue
-    def __init__(self, source: List[Any], shared_queue: SharedQueue, name: str = "Producer"):
+    # Items are put in batches of batch_size; verbose prints each item
+    # throttle sleeps that many seconds after each batch (demo pacing)
+    def __init__(self, source: List[Any], shared_queue: SharedQueue, name: str = "Producer",
+                 verbose: bool = False, throttle: float = 0.0, batch_size: int = 64):
         super().__init__(name=name)
         self.source = source
         self.shared_queue = shared_queue
+        self.verbose = verbose
+        self.throttle = throttle
+        self.batch_size = batch_size
         self.items_produced = 0
 
     # Main producer loop
     def run(self):
         logger.info(f"{self.name} started with {len(self.source)} items")
-        for item in self.source:
+        for start in range(0, len(self.source), self.batch_size):
             if self.shared_queue.closed:
                 logger.warning(f"{self.name} stopping - queue closed")
                 break
-            success = self.shared_queue.put(item)
-            if success:
-                self.items_produced += 1
-                print(f"[{self.name}] Produced: {item} (Queue size: {self.shared_queue.size()})")
-                time.sleep(random.uniform(0.01, 0.05))
+            batch = self.source[start:start + self.batch_size]
+            added = self.shared_queue.put_many(batch)
+            if added:
+                self.items_produced += added
+                if self.verbose:
+                    for item in batch[:added]:
+                        print(f"[{self.name}] Produced: {item} (Queue size: {self.shared_queue.size()})")
+                if self.throttle:
+                    time.sleep(self.throttle)
         logger.info(f"{self.name} finished - produced {self.items_produced} items")
-        print(f"[{self.name}] Finished. Total items produced: {self.items_produced}")
+        if self.verbose:
+            print(f"[{self.name}] Finished. Total items produced: {self.items_produced}")
 
 
 class Consumer(threading.Thread):
     # Consumer thread that reads from shared queue and stores in destination
-    def __init__(self, shared_queue: SharedQueue, destination: List[Any], name: str = "Consumer"):
+    # Items are taken in batches of up to batch_size; verbose prints each item
+    # throttle sleeps that many seconds after each batch (demo pacing)
+    def __init__(self, shared_queue: SharedQueue, destination: List[Any], name: str = "Consumer",
+                 verbose: bool = False, throttle: float = 0.0, batch_size: int = 64):
         super().__init__(name=name)
         self.shared_queue = shared_queue
         self.destination = destination
+        self.verbose = verbose
+        self.throttle = throttle
+        self.batch_size = batch_size
         self.items_consumed = 0
         self.running = True
 
@@ -107,17 +181,21 @@ class Consumer(threading.Thread):
     def run(self):
         logger.info(f"{self.name} started")
         while self.running:
-            item = self.shared_queue.get(timeout=0.5)
-            if item is not None:
-                self.destination.append(item)
-                self.items_consumed += 1
-                print(f"[{self.name}] Consumed: {item} (Queue size: {self.shared_queue.size()})")
-                time.sleep(random.uniform(0.02, 0.08))
+            batch = self.shared_queue.get_many(self.batch_size, timeout=0.5)
+            if batch:
+                self.destination.extend(batch)
+                self.items_consumed += len(batch)
+                if self.verbose:
+                    for item in batch:
+                        print(f"[{self.name}] Consumed: {item} (Queue size: {self.shared_queue.size()})")
+                if self.throttle:
+                    time.sleep(self.throttle)
             elif self.shared_queue.closed and self.shared_queue.is_empty():
                 logger.info(f"{self.name} exiting - queue closed and empty")
                 break
         logger.info(f"{self.name} finished - consumed {self.items_consumed} items")
-        print(f"[{self.name}] Finished. Total items consumed: {self.items_consumed}")
+        if self.verbose:
+            print(f"[{self.name}] Finished. Total items consumed: {self.items_consumed}")
 
     # Stop the consumer thread
     def stop(self):
@@ -134,19 +212,23 @@ class ProducerConsumerSystem:
         self.lock = threading.Lock()
 
     # Create and add a producer thread
-    def add_producer(self, source: List[Any], name: str = None) -> Producer:
+    def add_producer(self, source: List[Any], name: str = None, verbose: bool = False,
+                     throttle: float = 0.0, batch_size: int = 64) -> Producer:
         if name is None:
             name = f"Producer-{len(self.producers) + 1}"
-        producer = Producer(source, self.shared_queue, name)
+        producer = Producer(source, self.shared_queue, name, verbose=verbose, throttle=throttle,
+                            batch_size=batch_size)
         self.producers.append(producer)
         return producer
 
     # Create and add a consumer thread
-    def add_consumer(self, name: str = None) -> Consumer:
+    def add_consumer(self, name: str = None, verbose: bool = False, throttle: float = 0.0,
+                     batch_size: int = 64) -> Consumer:
         if name is None:
             name = f"Consumer-{len(self.consumers) + 1}"
         with self.lock:
-            consumer = Consumer(self.shared_queue, self.destination, name)
+            consumer = Consumer(self.shared_queue, self.destination, name, verbose=verbose,
+                                throttle=throttle, batch_size=batch_size)
         self.consumers.append(consumer)
         return consumer
 
@@ -186,8 +268,8 @@ def demo_single_producer_consumer():
     source_data = [f"Item-{i}" for i in range(1, 11)]
 
     system = ProducerConsumerSystem(queue_size=5)
-    system.add_producer(source_data, "Producer")
-    system.add_consumer("Consumer")
+    system.add_producer(source_data, "Producer", verbose=True, throttle=0.03, batch_size=1)
+    system.add_consumer("Consumer", verbose=True, throttle=0.03, batch_size=1)
 
     system.start()
     system.wait_for_completion()
@@ -207,10 +289,10 @@ def demo_multiple_producers_consumers():
     source2 = [f"B-{i}" for i in range(1, 8)]
 
     system = ProducerConsumerSystem(queue_size=5)
-    system.add_producer(source1, "Producer-A")
-    system.add_producer(source2, "Producer-B")
-    system.add_consumer("Consumer-1")
-    system.add_consumer("Consumer-2")
+    system.add_producer(source1, "Producer-A", verbose=True, throttle=0.03, batch_size=1)
+    system.add_producer(source2, "Producer-B", verbose=True, throttle=0.03, batch_size=1)
+    system.add_consumer("Consumer-1", verbose=True, throttle=0.03, batch_size=1)
+    system.add_consumer("Consumer-2", verbose=True, throttle=0.03, batch_size=1)
 
     system.start()
     system.wait_for_completion()
@@ -1,6 +1,8 @@
 import unittest
 import threading
 import time
+import io
+from contextlib import redirect_stdout
 from producer_consumer import SharedQueue, Producer, Consumer, ProducerConsumerSystem
 
 
@@ -82,6 +84,47 @@ class TestSharedQueue(unittest.TestCase):
         for expected in items:
             self.assertEqual(sq.get(), expected)
 
+    def test_wraparound_preserves_order(self):
+        # Test FIFO order while head and tail wrap around the ring buffer
+        sq = SharedQueue(max_size=3)
+        expected = []
+        result = []
+        for i in range(0, 30, 2):
+            sq.put_many([i, i + 1])
+            expected.extend([i, i + 1])
+            result.extend(sq.get_many(2))
+        self.assertEqual(result, expected)
+        self.assertTrue(sq.is_empty())
+
+    def test_put_many_get_many(self):
+        # Test batch put and get preserve FIFO order
+        sq = SharedQueue(max_size=10)
+        self.assertEqual(sq.put_many([1, 2, 3, 4, 5]), 5)
+        self.assertEqual(sq.get_many(3), [1, 2, 3])
+        self.assertEqual(sq.get_many(10), [4, 5])
+        self.assertEqual(sq.get_many(10, timeout=0.05), [])
+
+    def test_put_many_blocks_on_full(self):
+        # Test that a batch larger than the queue waits for space
+        sq = SharedQueue(max_size=2)
+        result = []
+        def drain():
+            while len(result) < 5:
+                result.extend(sq.get_many(2, timeout=1))
+
+        getter = threading.Thread(target=drain)
+        getter.start()
+        self.assertEqual(sq.put_many([1, 2, 3, 4, 5]), 5)
+        getter.join()
+        self.assertEqual(result, [1, 2, 3, 4, 5])
+
+    def test_put_many_on_closed_queue(self):
+        # Test that put_many adds nothing once the queue is closed
+        sq = SharedQueue(max_size=5)
+        sq.close()
+        self.assertEqual(sq.put_many(["a", "b"]), 0)
+        self.assertTrue(sq.is_empty())
+
 
 class TestProducer(unittest.TestCase):
     # Tests for the Producer class
@@ -113,6 +156,23 @@ class TestProducer(unittest.TestCase):
 
         self.assertEqual(producer.items_produced, len(source))
 
+    def test_producer_quiet_by_default(self):
+        # Test that per-item output is only printed in verbose mode
+        sq = SharedQueue(max_size=10)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            producer = Producer(["a", "b"], sq, "QuietProducer")
+            producer.start()
+            producer.join()
+        self.assertEqual(output.getvalue(), "")
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            producer = Producer(["c"], sq, "LoudProducer", verbose=True)
+            producer.start()
+            producer.join()
+        self.assertIn("[LoudProducer] Produced: c", output.getvalue())
+
 
 class TestConsumer(unittest.TestCase):
     # Tests for the Consumer class
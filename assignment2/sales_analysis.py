@@ -1,18 +1,201 @@
 import csv
+import functools
+import heapq
+import io
 import logging
-from functools import reduce
-from itertools import groupby
-from operator import itemgetter
-from typing import List, Dict, Any, Callable
+import operator
+import os
+from array import array
+from itertools import compress, repeat
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Callable, Iterable, Sequence, Tuple
 from datetime import datetime
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# Optional: pyarrow's multithreaded CSV reader backs SalesAnalyzer(..., engine='pyarrow')
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# CSV header names, in SalesData.__slots__ order
+_CSV_COLUMNS = ('Order ID', 'Product', 'Category', 'Quantity', 'Unit Price', 'Total Price',
+                'Order Date', 'Region', 'Customer ID', 'Payment Method')
+# Numeric SalesData attributes stored as typed arrays, with their array typecode and parser
+_NUMERIC_FIELDS = {'order_id': ('q', int), 'quantity': ('q', int),
+                   'unit_price': ('d', float), 'total_price': ('d', float)}
+# String SalesData attributes stored as integer codes into a label list
+_KEY_FIELDS = ('product', 'category', 'region', 'customer_id', 'payment_method')
+# Fields kept as (codes, labels) by _encode_columns; order dates are decoded after merging
+_ENCODED_FIELDS = _KEY_FIELDS + ('order_date',)
+# Labels for the derived weekday codes, indexed by datetime.weekday()
+_DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+# Default byte size of the chunks SalesAnalyzer.from_large_csv parses per worker task
+_LARGE_CSV_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def _factorize(values: Sequence[Any]) -> Tuple[array, List[Any]]:
+    # Encode values as integer codes in first-seen order, returns (codes, labels)
+    # Both passes run in C: dict.fromkeys collects labels, map looks up each code
+    labels = list(dict.fromkeys(values))
+    index = {label: code for code, label in enumerate(labels)}
+    return array('l', map(index.__getitem__, values)), labels
+
+
+def _encode_columns(raw: Dict[str, Sequence[Any]]) -> Dict[str, Any]:
+    # Encode raw values keyed by field: numeric fields as typed arrays, key fields and
+    # order dates as (codes, labels) from _factorize
+    encoded = {field: array(typecode, map(parse, raw[field]))
+               for field, (typecode, parse) in _NUMERIC_FIELDS.items()}
+    for field in _ENCODED_FIELDS:
+        encoded[field] = _factorize(raw[field])
+    return encoded
+
+
+def _merge_encoded(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    # Concatenate encoded chunks in order; each chunk's codes are remapped to merged labels,
+    # which keep first-seen order across the whole file
+    merged = {field: array(typecode) for field, (typecode, _) in _NUMERIC_FIELDS.items()}
+    for field in _NUMERIC_FIELDS:
+        for part in parts:
+            merged[field].extend(part[field])
+    for field in _ENCODED_FIELDS:
+        codes, index = array('l'), {}
+        for part_codes, part_labels in (part[field] for part in parts):
+            remap = [index.setdefault(label, len(index)) for label in part_labels]
+            codes.extend(map(remap.__getitem__, part_codes))
+        merged[field] = (codes, list(index))
+    return merged
+
+
+def _transpose_rows(rows: Iterable[List[str]], header: List[str]) -> Dict[str, Sequence[str]]:
+    # Resolve column positions once from the header instead of building a dict per row,
+    # then transpose the rows into one tuple of raw strings per SalesData field
+    pick = itemgetter(*(header.index(column) for column in _CSV_COLUMNS))
+    raw = list(zip(*(pick(row) for row in rows if row)))
+    return dict(zip(SalesData.__slots__, raw or [()] * len(_CSV_COLUMNS)))
+
+
+def _read_csv_columns(file_path: str) -> Dict[str, Any]:
+    # Read and encode all columns with the stdlib csv module
+    with open(file_path, 'r', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return _encode_columns(dict.fromkeys(SalesData.__slots__, ()))
+        return _encode_columns(_transpose_rows(reader, header))
+
+
+def _read_arrow_columns(file_path: str) -> Dict[str, Any]:
+    # Read and encode all columns with pyarrow; numeric columns arrive already typed and
+    # pass through the int/float parsers unchanged, dates stay strings for fromisoformat
+    arrow_types = {'q': pa.int64(), 'd': pa.float64()}
+    column_types = {column: arrow_types[_NUMERIC_FIELDS[field][0]] if field in _NUMERIC_FIELDS
+                    else pa.string()
+                    for column, field in zip(_CSV_COLUMNS, SalesData.__slots__)}
+    table = pa_csv.read_csv(file_path, convert_options=pa_csv.ConvertOptions(
+        column_types=column_types, include_columns=list(_CSV_COLUMNS)))
+    return _encode_columns({field: table.column(column).to_pylist()
+                            for column, field in zip(_CSV_COLUMNS, SalesData.__slots__)})
+
+
+# Column readers for each CSV parsing backend accepted by SalesAnalyzer
+_ENGINE_READERS = {'python': _read_csv_columns, 'pyarrow': _read_arrow_columns}
+
+
+def _chunk_ranges(file_path: str, chunk_bytes: int) -> List[Tuple[int, int]]:
+    # Byte ranges of about chunk_bytes covering the rows after the header, each ending on a
+    # line break; quoted fields therefore must not contain line breaks themselves
+    with open(file_path, 'rb') as file:
+        file.readline()
+        size = os.fstat(file.fileno()).st_size
+        offsets = [file.tell()]
+        while offsets[-1] < size:
+            file.seek(offsets[-1] + max(chunk_bytes, 1) - 1)
+            file.readline()
+            offsets.append(min(file.tell(), size))
+    return list(zip(offsets, offsets[1:]))
+
+
+def _read_csv_chunk(file_path: str, header: List[str], start: int, end: int) -> Dict[str, Any]:
+    # Read and encode the rows in one byte range of the file
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    return _encode_columns(_transpose_rows(csv.reader(io.StringIO(text, newline='')), header))
+
+
+def _read_csv_chunks(file_path: str, chunk_bytes: int, max_workers: int = None) -> Dict[str, Any]:
+    # Read and encode byte-range chunks in worker processes, then merge them in file order
+    with open(file_path, 'r', encoding='utf-8') as file:
+        header = next(csv.reader(file), None)
+    if header is None:
+        return _encode_columns(dict.fromkeys(SalesData.__slots__, ()))
+    ranges = _chunk_ranges(file_path, chunk_bytes)
+    if len(ranges) <= 1:
+        return _merge_encoded([_read_csv_chunk(file_path, header, start, end)
+                               for start, end in ranges])
+    logger.info(f"Parsing {len(ranges)} chunks in worker processes")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_read_csv_chunk, file_path, header, start, end)
+                   for start, end in ranges]
+        return _merge_encoded([future.result() for future in futures])
+
+
+# Argument-free aggregations that SalesAnalyzer.precompute can run in worker processes
+_PARALLEL_AGGREGATIONS = ('revenue_by_category', 'revenue_by_region', 'orders_by_payment_method',
+                          'quantity_by_product', 'monthly_revenue', 'category_breakdown',
+                          'regional_performance')
+
+# Results a memoized method keeps for distinct arguments before evicting the oldest
+_MAX_CACHED_CALLS = 32
+
+# Analyzer shared by the aggregation tasks of one worker process
+_worker_analyzer = None
+
+
+def _cache_key(name: str, args: tuple = (), kwargs: Dict[str, Any] = None) -> tuple:
+    # Key under which a memoized SalesAnalyzer method stores a result
+    return (name, args, tuple(sorted(kwargs.items())) if kwargs else ())
+
+
+def _memoized(method: Callable) -> Callable:
+    # Cache a SalesAnalyzer method's result per instance and arguments; the loaded data is
+    # never modified, so results stay valid. Cached results are shared - treat them as read-only
+    # Calls with arguments keep at most _MAX_CACHED_CALLS results per method, oldest evicted first
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = _cache_key(method.__name__, args, kwargs)
+        if key not in self._cache:
+            if args or kwargs:
+                calls = [k for k in self._cache if k[0] == method.__name__ and (k[1] or k[2])]
+                if len(calls) >= _MAX_CACHED_CALLS:
+                    del self._cache[calls[0]]
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+    return wrapper
+
+
+def _init_worker(analyzer: 'SalesAnalyzer'):
+    # Receive the analyzer once per worker process instead of once per task
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _run_aggregation(name: str) -> Any:
+    # Run one named aggregation on the worker's analyzer
+    return getattr(_worker_analyzer, name)()
+
 
 class SalesData:
     # Container for a single sales record
+    __slots__ = ('order_id', 'product', 'category', 'quantity', 'unit_price', 'total_price',
+                 'order_date', 'region', 'customer_id', 'payment_method')
+
     def __init__(self, record: Dict[str, Any]):
         self.order_id = int(record['Order ID'])
         self.product = record['Product']
@@ -20,29 +203,88 @@ class SalesData:
         self.quantity = int(record['Quantity'])
         self.unit_price = float(record['Unit Price'])
         self.total_price = float(record['Total Price'])
-        self.order_date = datetime.strptime(record['Order Date'], '%Y-%m-%d')
+        self.order_date = datetime.fromisoformat(record['Order Date'])
         self.region = record['Region']
         self.customer_id = record['Customer ID']
         self.payment_method = record['Payment Method']
 
+    # Build a record from already-typed values in __slots__ order
+    @classmethod
+    def _from_values(cls, values: Tuple[Any, ...]) -> 'SalesData':
+        sale = cls.__new__(cls)
+        for name, value in zip(cls.__slots__, values):
+            setattr(sale, name, value)
+        return sale
+
     def __repr__(self):
         return f"SalesData({self.order_id}, {self.product}, ${self.total_price:.2f})"
 
 
+class _LazyRows(Sequence[SalesData]):
+    # Read-only sequence of SalesData records over an analyzer's columns
+    # len() and indexing never build the full record list; the first full iteration builds
+    # it once and keeps it, since predicate scans like filter_sales repeat over every row
+    def __init__(self, analyzer: 'SalesAnalyzer'):
+        self._analyzer = analyzer
+        self._built: List[SalesData] = None
+
+    def __len__(self) -> int:
+        return len(self._analyzer)
+
+    def __getitem__(self, index):
+        if self._built is not None:
+            return self._built[index]
+        rows = range(len(self._analyzer))[index]
+        if isinstance(index, slice):
+            return self._analyzer._records(rows)
+        return SalesData._from_values(self._analyzer._row_values(rows))
+
+    def __iter__(self):
+        if self._built is None:
+            fields = [self._analyzer._field_values(field) for field in SalesData.__slots__]
+            self._built = list(map(SalesData._from_values, zip(*fields)))
+        return iter(self._built)
+
+
 class SalesAnalyzer:
     # Performs various analytical operations on sales data
-    def __init__(self, csv_file_path: str):
-        self.data: List[SalesData] = []
-        self._load_data(csv_file_path)
-
-    # Load and parse CSV file into SalesData objects
-    def _load_data(self, file_path: str):
+    # engine selects the CSV parser: 'python' (stdlib csv) or 'pyarrow' (needs pyarrow installed)
+    def __init__(self, csv_file_path: str, engine: str = 'python'):
+        if engine not in _ENGINE_READERS:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {tuple(_ENGINE_READERS)}")
+        if engine == 'pyarrow' and pa is None:
+            raise ImportError("engine='pyarrow' requires the pyarrow package")
+        self._init_storage()
+        self._load_data(csv_file_path, _ENGINE_READERS[engine])
+
+    # Load a large CSV by parsing byte-range chunks of about chunk_bytes in worker processes
+    # and merging their columns; rows must not contain line breaks inside quoted fields
+    @classmethod
+    def from_large_csv(cls, csv_file_path: str, chunk_bytes: int = _LARGE_CSV_CHUNK_BYTES,
+                       max_workers: int = None) -> 'SalesAnalyzer':
+        analyzer = cls.__new__(cls)
+        analyzer._init_storage()
+        analyzer._load_data(csv_file_path, functools.partial(
+            _read_csv_chunks, chunk_bytes=chunk_bytes, max_workers=max_workers))
+        return analyzer
+
+    # Empty column storage, record view and result cache
+    def _init_storage(self):
+        self._rows = _LazyRows(self)
+        self._row_count = 0
+        self._columns: Dict[str, Any] = {}
+        self._codes: Dict[str, array] = {}
+        self._labels: Dict[str, List[str]] = {}
+        self._cache: Dict[tuple, Any] = {}
+
+    # Load and parse CSV file into typed columns using a reader from _ENGINE_READERS
+    def _load_data(self, file_path: str, read_columns: Callable[[str], Dict[str, Any]]):
         logger.info(f"Loading data from {file_path}")
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                self.data = list(map(lambda row: SalesData(row), reader))
-            logger.info(f"Loaded {len(self.data)} records")
+            self._build_columns(read_columns(file_path))
+            self._rows = _LazyRows(self)
+            self._cache.clear()
+            logger.info(f"Loaded {self._row_count} records")
         except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
             raise
@@ -50,140 +292,256 @@ class SalesAnalyzer:
             logger.error(f"Error loading data: {e}")
             raise
 
+    # Build column storage from _encode_columns output: numeric fields as typed arrays,
+    # string fields as integer codes plus labels
+    def _build_columns(self, encoded: Dict[str, Any]):
+        self._row_count = len(encoded['order_id'])
+        for field in _NUMERIC_FIELDS:
+            self._columns[field] = encoded[field]
+        for field in _KEY_FIELDS:
+            self._codes[field], self._labels[field] = encoded[field]
+        # Orders share few distinct dates, so parse each date string once and derive the
+        # month and weekday keys per distinct date, then spread them to rows by date code
+        date_codes, date_strings = encoded['order_date']
+        dates = list(map(datetime.fromisoformat, date_strings))
+        self._columns['order_date'] = list(map(dates.__getitem__, date_codes))
+        month_codes, months = _factorize([(date.year, date.month) for date in dates])
+        self._codes['month'] = array('l', map(month_codes.__getitem__, date_codes))
+        self._labels['month'] = [f"{year:04d}-{month:02d}" for year, month in months]
+        weekdays = [date.weekday() for date in dates]
+        self._codes['weekday'] = array('l', map(weekdays.__getitem__, date_codes))
+        self._labels['weekday'] = _DAY_NAMES
+
+    # Iterate one field's values in row order, decoding key codes to their labels
+    def _field_values(self, name: str) -> Iterable[Any]:
+        if name in self._codes:
+            return map(self._labels[name].__getitem__, self._codes[name])
+        return self._columns[name]
+
+    # SalesData records as a lazy sequence over the columns
+    @property
+    def data(self) -> Sequence[SalesData]:
+        return self._rows
+
+    # Typed field values of one row, in SalesData.__slots__ order
+    def _row_values(self, i: int) -> Tuple[Any, ...]:
+        return tuple(self._columns[field][i] if field in self._columns
+                     else self._labels[field][self._codes[field][i]]
+                     for field in SalesData.__slots__)
+
+    # Records at the given row indices, built individually unless all records already exist
+    def _records(self, indices: Iterable[int]) -> List[SalesData]:
+        if self._rows._built is not None:
+            return [self._rows._built[i] for i in indices]
+        return [SalesData._from_values(self._row_values(i)) for i in indices]
+
+    # Number of loaded records
+    def __len__(self) -> int:
+        return self._row_count
+
+    # Sum a numeric column grouped by a key column, accumulating into a list indexed by code
+    def _group_sum(self, key: str, value: str) -> Dict[str, Any]:
+        sums = [0] * len(self._labels[key])
+        for code, v in zip(self._codes[key], self._columns[value]):
+            sums[code] += v
+        return dict(zip(self._labels[key], sums))
+
+    # Count records per key column value
+    def _group_count(self, key: str) -> Dict[str, int]:
+        counts = [0] * len(self._labels[key])
+        for code in self._codes[key]:
+            counts[code] += 1
+        return dict(zip(self._labels[key], counts))
+
     # Calculate total revenue across all sales
+    @_memoized
     def total_revenue(self) -> float:
-        return reduce(lambda acc, sale: acc + sale.total_price, self.data, 0.0)
+        return sum(self._columns['total_price'], 0.0)
 
     # Calculate average order value
+    @_memoized
     def average_order_value(self) -> float:
-        if not self.data:
+        if not self._row_count:
             logger.warning("No data available for average calculation")
             return 0.0
         total = self.total_revenue()
-        return total / len(self.data)
+        return total / self._row_count
 
     # Group sales by category and sum totals
+    @_memoized
     def revenue_by_category(self) -> Dict[str, float]:
-        result = defaultdict(float)
-        for sale in self.data:
-            result[sale.category] += sale.total_price
-        return dict(sorted(result.items(), key=lambda x: x[1], reverse=True))
+        result = self._group_sum('category', 'total_price')
+        return dict(sorted(result.items(), key=itemgetter(1), reverse=True))
 
     # Group sales by region and sum totals
+    @_memoized
     def revenue_by_region(self) -> Dict[str, float]:
-        result = defaultdict(float)
-        for sale in self.data:
-            result[sale.region] += sale.total_price
-        return dict(sorted(result.items(), key=lambda x: x[1], reverse=True))
+        result = self._group_sum('region', 'total_price')
+        return dict(sorted(result.items(), key=itemgetter(1), reverse=True))
 
     # Count orders by payment method
+    @_memoized
     def orders_by_payment_method(self) -> Dict[str, int]:
-        result = defaultdict(int)
-        for sale in self.data:
-            result[sale.payment_method] += 1
-        return dict(sorted(result.items(), key=lambda x: x[1], reverse=True))
+        result = self._group_count('payment_method')
+        return dict(sorted(result.items(), key=itemgetter(1), reverse=True))
 
     # Get top N products by revenue
+    @_memoized
     def top_products_by_revenue(self, n: int = 5) -> List[tuple]:
-        product_revenue = defaultdict(float)
-        for sale in self.data:
-            product_revenue[sale.product] += sale.total_price
-        sorted_products = sorted(product_revenue.items(), key=lambda x: x[1], reverse=True)
-        return sorted_products[:n]
+        product_revenue = self._group_sum('product', 'total_price')
+        return heapq.nlargest(n, product_revenue.items(), key=itemgetter(1))
 
     # Get top N customers by total spending
+    @_memoized
     def top_customers(self, n: int = 5) -> List[tuple]:
-        customer_spending = defaultdict(float)
-        for sale in self.data:
-            customer_spending[sale.customer_id] += sale.total_price
-        sorted_customers = sorted(customer_spending.items(), key=lambda x: x[1], reverse=True)
-        return sorted_customers[:n]
+        customer_spending = self._group_sum('customer_id', 'total_price')
+        return heapq.nlargest(n, customer_spending.items(), key=itemgetter(1))
 
     # Calculate total quantity sold per product
+    @_memoized
     def quantity_by_product(self) -> Dict[str, int]:
-        result = defaultdict(int)
-        for sale in self.data:
-            result[sale.product] += sale.quantity
-        return dict(sorted(result.items(), key=lambda x: x[1], reverse=True))
+        result = self._group_sum('product', 'quantity')
+        return dict(sorted(result.items(), key=itemgetter(1), reverse=True))
 
     # Group revenue by month
+    @_memoized
     def monthly_revenue(self) -> Dict[str, float]:
-        result = defaultdict(float)
-        for sale in self.data:
-            month_key = sale.order_date.strftime('%Y-%m')
-            result[month_key] += sale.total_price
-        return dict(sorted(result.items()))
+        return dict(sorted(self._group_sum('month', 'total_price').items()))
 
     # Filter sales by custom predicate function
     def filter_sales(self, predicate: Callable[[SalesData], bool]) -> List[SalesData]:
         return list(filter(predicate, self.data))
 
+    # Records whose row masks are all true; masks are per-row boolean iterables
+    def _select(self, masks: List[Iterable[bool]]) -> List[SalesData]:
+        rows = range(self._row_count)
+        if not masks:
+            return self._records(rows)
+        mask = masks[0] if len(masks) == 1 else map(all, zip(*masks))
+        return self._records(compress(rows, mask))
+
+    # Filter sales by field equality, e.g. filter_by(category='Electronics', region='North')
+    # Compares column values in C instead of calling a predicate per record
+    def filter_by(self, **conditions: Any) -> List[SalesData]:
+        masks = []
+        for field, value in conditions.items():
+            if field in self._codes:
+                labels = self._labels[field]
+                if value not in labels:
+                    return []
+                masks.append(map(operator.eq, self._codes[field], repeat(labels.index(value))))
+            else:
+                masks.append(map(operator.eq, self._columns[field], repeat(value)))
+        return self._select(masks)
+
+    # Filter sales whose numeric or date field is strictly above gt and/or strictly below lt
+    def filter_range(self, field: str, gt: Any = None, lt: Any = None) -> List[SalesData]:
+        column = self._columns[field]
+        masks = []
+        if gt is not None:
+            masks.append(map(operator.gt, column, repeat(gt)))
+        if lt is not None:
+            masks.append(map(operator.lt, column, repeat(lt)))
+        return self._select(masks)
+
     # Apply transformation to all sales records
     def map_sales(self, transform: Callable[[SalesData], Any]) -> List[Any]:
         return list(map(transform, self.data))
 
+    # Get one field for all sales records, e.g. column('total_price')
+    # Reads the column store directly; prefer it to map_sales for single-attribute lookups
+    def column(self, name: str) -> List[Any]:
+        return list(self._field_values(name))
+
     # Get sales statistics summary
+    @_memoized
     def get_statistics(self) -> Dict[str, Any]:
-        prices = self.map_sales(lambda s: s.total_price)
-        quantities = self.map_sales(lambda s: s.quantity)
+        prices = self._columns['total_price']
         return {
-            'total_orders': len(self.data),
+            'total_orders': self._row_count,
             'total_revenue': self.total_revenue(),
             'average_order_value': self.average_order_value(),
             'min_order_value': min(prices) if prices else 0,
             'max_order_value': max(prices) if prices else 0,
-            'total_items_sold': sum(quantities),
-            'unique_products': len(set(self.map_sales(lambda s: s.product))),
-            'unique_customers': len(set(self.map_sales(lambda s: s.customer_id)))
+            'total_items_sold': sum(self._columns['quantity']),
+            'unique_products': len(self._labels['product']),
+            'unique_customers': len(self._labels['customer_id'])
         }
 
+    # Per-group order count, revenue, min and max order in one pass over a key column
+    # Kept as parallel lists indexed by code so the loop body only does flat list updates
+    def _group_stats(self, key: str) -> Tuple[List[int], List[float], List[float], List[float]]:
+        groups = len(self._labels[key])
+        counts, totals = [0] * groups, [0] * groups
+        lows, highs = [float('inf')] * groups, [float('-inf')] * groups
+        for code, price in zip(self._codes[key], self._columns['total_price']):
+            counts[code] += 1
+            totals[code] += price
+            if price < lows[code]:
+                lows[code] = price
+            if price > highs[code]:
+                highs[code] = price
+        return counts, totals, lows, highs
+
+    # Number of distinct values of one key column within each group of another
+    def _group_distinct(self, key: str, other: str) -> List[int]:
+        seen = [set() for _ in self._labels[key]]
+        for code, other_code in zip(self._codes[key], self._codes[other]):
+            seen[code].add(other_code)
+        return [len(values) for values in seen]
+
     # Get category-wise breakdown with detailed stats
+    @_memoized
     def category_breakdown(self) -> Dict[str, Dict[str, Any]]:
-        categories = defaultdict(list)
-        for sale in self.data:
-            categories[sale.category].append(sale)
-
         result = {}
-        for category, sales in categories.items():
-            revenues = [s.total_price for s in sales]
+        for category, count, revenue, low, high in zip(self._labels['category'],
+                                                       *self._group_stats('category')):
             result[category] = {
-                'order_count': len(sales),
-                'total_revenue': sum(revenues),
-                'avg_order_value': sum(revenues) / len(revenues),
-                'min_order': min(revenues),
-                'max_order': max(revenues)
+                'order_count': count,
+                'total_revenue': revenue,
+                'avg_order_value': revenue / count,
+                'min_order': low,
+                'max_order': high
             }
         return result
 
     # Get region-wise performance metrics
+    @_memoized
     def regional_performance(self) -> Dict[str, Dict[str, Any]]:
-        regions = defaultdict(list)
-        for sale in self.data:
-            regions[sale.region].append(sale)
-
+        counts, totals, _, _ = self._group_stats('region')
+        customers = self._group_distinct('region', 'customer_id')
         result = {}
-        for region, sales in regions.items():
-            revenues = [s.total_price for s in sales]
+        for region, count, revenue, unique in zip(self._labels['region'], counts, totals, customers):
             result[region] = {
-                'order_count': len(sales),
-                'total_revenue': sum(revenues),
-                'avg_order_value': sum(revenues) / len(revenues),
-                'unique_customers': len(set(s.customer_id for s in sales))
+                'order_count': count,
+                'total_revenue': revenue,
+                'avg_order_value': revenue / count,
+                'unique_customers': unique
             }
         return result
 
+    # Run the independent aggregations across worker processes and cache their results
+    # Each worker gets a pickled copy of the analyzer, so this only pays off for large data sets
+    def precompute(self, max_workers: int = None):
+        pending = [name for name in _PARALLEL_AGGREGATIONS if _cache_key(name) not in self._cache]
+        if not pending:
+            return
+        logger.info(f"Precomputing {len(pending)} aggregations in worker processes")
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            for name, result in zip(pending, executor.map(_run_aggregation, pending)):
+                self._cache[_cache_key(name)] = result
+
     # Find orders above a certain value threshold
+    @_memoized
     def high_value_orders(self, threshold: float = 1000.0) -> List[SalesData]:
-        return self.filter_sales(lambda s: s.total_price >= threshold)
+        return self._select([map(operator.ge, self._columns['total_price'], repeat(threshold))])
 
     # Get revenue by day of week
+    @_memoized
     def revenue_by_day_of_week(self) -> Dict[str, float]:
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        result = defaultdict(float)
-        for sale in self.data:
-            day_name = days[sale.order_date.weekday()]
-            result[day_name] += sale.total_price
-        return {day: result[day] for day in days if result[day] > 0}
+        totals = self._group_sum('weekday', 'total_price')
+        return {day: total for day, total in totals.items() if total > 0}
 
 
 def print_section(title: str):
@@ -198,14 +556,17 @@ def format_currency(value: float) -> str:
     return f"${value:,.2f}"
 
 
-def run_analysis(csv_path: str):
+def run_analysis(csv_path: str, workers: int = None):
     # Execute all analysis operations and print results
+    # When workers is set, the independent aggregations are computed in that many processes first
     logger.info(f"Starting analysis for {csv_path}")
     analyzer = SalesAnalyzer(csv_path)
+    if workers:
+        analyzer.precompute(max_workers=workers)
 
     print_section("SALES DATA ANALYSIS REPORT")
     print(f"Data source: {csv_path}")
-    print(f"Total records loaded: {len(analyzer.data)}")
+    print(f"Total records loaded: {len(analyzer)}")
 
     print_section("1. OVERALL STATISTICS")
     stats = analyzer.get_statistics()
@@ -258,7 +619,7 @@ def run_analysis(csv_path: str):
     print_section("9. HIGH VALUE ORDERS (>$1000)")
     high_value = analyzer.high_value_orders(1000.0)
     print(f"Found {len(high_value)} high-value orders:")
-    for sale in sorted(high_value, key=lambda s: s.total_price, reverse=True)[:10]:
+    for sale in heapq.nlargest(10, high_value, key=attrgetter('total_price')):
         print(f"  Order #{sale.order_id}: {sale.product} - {format_currency(sale.total_price)}")
 
     print_section("10. QUANTITY ANALYSIS (Top 10 Products)")
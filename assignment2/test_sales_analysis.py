@@ -1,8 +1,48 @@
 import unittest
+import atexit
 import os
+import shutil
 import tempfile
+import types
 import csv
-from sales_analysis import SalesData, SalesAnalyzer
+from datetime import datetime
+import sales_analysis
+from sales_analysis import SalesData, SalesAnalyzer, _MAX_CACHED_CALLS
+
+# Read-only raw record for SalesData construction tests; SalesData only reads it
+_SAMPLE_RECORD = types.MappingProxyType({
+    'Order ID': '1001',
+    'Product': 'Laptop',
+    'Category': 'Electronics',
+    'Quantity': '2',
+    'Unit Price': '999.99',
+    'Total Price': '1999.98',
+    'Order Date': '2024-01-15',
+    'Region': 'North',
+    'Customer ID': 'C001',
+    'Payment Method': 'Credit Card'
+})
+
+# Sample CSV written and parsed once per test run, shared by every TestSalesAnalyzerBase subclass
+_TEST_DATA = (
+    ('Order ID', 'Product', 'Category', 'Quantity', 'Unit Price', 'Total Price', 'Order Date', 'Region', 'Customer ID', 'Payment Method'),
+    ('1', 'Laptop', 'Electronics', '2', '1000', '2000', '2024-01-15', 'North', 'C001', 'Credit Card'),
+    ('2', 'Chair', 'Furniture', '5', '100', '500', '2024-01-16', 'South', 'C002', 'PayPal'),
+    ('3', 'Mouse', 'Electronics', '10', '25', '250', '2024-01-17', 'North', 'C001', 'Credit Card'),
+    ('4', 'Desk', 'Furniture', '1', '300', '300', '2024-02-01', 'East', 'C003', 'Debit Card'),
+    ('5', 'Monitor', 'Electronics', '3', '400', '1200', '2024-02-15', 'South', 'C004', 'PayPal'),
+)
+_TEMP_DIR = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, _TEMP_DIR, ignore_errors=True)
+_CSV_PATH = os.path.join(_TEMP_DIR, 'test_sales.csv')
+with open(_CSV_PATH, 'w', newline='') as _f:
+    csv.writer(_f).writerows(_TEST_DATA)
+_SHARED_ANALYZER = SalesAnalyzer(_CSV_PATH)
+
+# Bundled sales_data.csv, parsed once at import when present
+_REAL_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sales_data.csv')
+_HAS_REAL_DATA = os.path.exists(_REAL_CSV)
+_REAL_ANALYZER = SalesAnalyzer(_REAL_CSV) if _HAS_REAL_DATA else None
 
 
 class TestSalesData(unittest.TestCase):
@@ -10,19 +50,7 @@ class TestSalesData(unittest.TestCase):
 
     def test_sales_data_creation(self):
         # Test creating a SalesData object from dict
-        record = {
-            'Order ID': '1001',
-            'Product': 'Laptop',
-            'Category': 'Electronics',
-            'Quantity': '2',
-            'Unit Price': '999.99',
-            'Total Price': '1999.98',
-            'Order Date': '2024-01-15',
-            'Region': 'North',
-            'Customer ID': 'C001',
-            'Payment Method': 'Credit Card'
-        }
-        sale = SalesData(record)
+        sale = SalesData(_SAMPLE_RECORD)
         self.assertEqual(sale.order_id, 1001)
         self.assertEqual(sale.product, 'Laptop')
         self.assertEqual(sale.category, 'Electronics')
@@ -39,30 +67,9 @@ class TestSalesAnalyzerBase(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        # Create temporary CSV file for testing
-        cls.temp_dir = tempfile.mkdtemp()
-        cls.csv_path = os.path.join(cls.temp_dir, 'test_sales.csv')
-
-        test_data = [
-            ['Order ID', 'Product', 'Category', 'Quantity', 'Unit Price', 'Total Price', 'Order Date', 'Region', 'Customer ID', 'Payment Method'],
-            ['1', 'Laptop', 'Electronics', '2', '1000', '2000', '2024-01-15', 'North', 'C001', 'Credit Card'],
-            ['2', 'Chair', 'Furniture', '5', '100', '500', '2024-01-16', 'South', 'C002', 'PayPal'],
-            ['3', 'Mouse', 'Electronics', '10', '25', '250', '2024-01-17', 'North', 'C001', 'Credit Card'],
-            ['4', 'Desk', 'Furniture', '1', '300', '300', '2024-02-01', 'East', 'C003', 'Debit Card'],
-            ['5', 'Monitor', 'Electronics', '3', '400', '1200', '2024-02-15', 'South', 'C004', 'PayPal'],
-        ]
-
-        with open(cls.csv_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerows(test_data)
-
-        cls.analyzer = SalesAnalyzer(cls.csv_path)
-
-    @classmethod
-    def tearDownClass(cls):
-        # Clean up temp files
-        os.remove(cls.csv_path)
-        os.rmdir(cls.temp_dir)
+        # Reuse the module-level analyzer instead of rebuilding it per subclass
+        cls.csv_path = _CSV_PATH
+        cls.analyzer = _SHARED_ANALYZER
 
 
 class TestSalesAnalyzerBasicOperations(TestSalesAnalyzerBase):
@@ -71,6 +78,26 @@ class TestSalesAnalyzerBasicOperations(TestSalesAnalyzerBase):
     def test_data_loading(self):
         # Test that data is loaded correctly
         self.assertEqual(len(self.analyzer.data), 5)
+        self.assertEqual(len(self.analyzer), 5)
+
+    def test_records_from_columns(self):
+        # Test that records built from the column store carry typed values
+        sale = self.analyzer.data[0]
+        self.assertEqual(sale.order_id, 1)
+        self.assertEqual(sale.product, 'Laptop')
+        self.assertEqual(sale.quantity, 2)
+        self.assertAlmostEqual(sale.total_price, 2000, places=2)
+        self.assertEqual(sale.order_date, datetime(2024, 1, 15))
+        self.assertEqual(sale.payment_method, 'Credit Card')
+
+    def test_data_is_lazy_sequence(self):
+        # Test indexing, slicing and iteration of the lazily built records
+        data = self.analyzer.data
+        self.assertEqual(data[-1].order_id, 5)
+        self.assertEqual([s.order_id for s in data[1:3]], [2, 3])
+        self.assertEqual([s.order_id for s in data], [1, 2, 3, 4, 5])
+        with self.assertRaises(IndexError):
+            data[5]
 
     def test_total_revenue(self):
         # Test total revenue calculation
@@ -138,6 +165,13 @@ class TestSalesAnalyzerMonthly(TestSalesAnalyzerBase):
         jan_revenue = 2000 + 500 + 250
         self.assertAlmostEqual(result['2024-01'], jan_revenue, places=2)
 
+    def test_revenue_by_day_of_week(self):
+        # Test revenue grouping by weekday, omitting days without sales
+        result = self.analyzer.revenue_by_day_of_week()
+        self.assertEqual(list(result), ['Monday', 'Tuesday', 'Wednesday', 'Thursday'])
+        self.assertAlmostEqual(result['Monday'], 2000, places=2)
+        self.assertAlmostEqual(result['Thursday'], 300 + 1200, places=2)
+
 
 class TestSalesAnalyzerFiltering(TestSalesAnalyzerBase):
     # Tests for filtering operations
@@ -157,6 +191,26 @@ class TestSalesAnalyzerFiltering(TestSalesAnalyzerBase):
         north = self.analyzer.filter_sales(lambda s: s.region == 'North')
         self.assertEqual(len(north), 2)
 
+    def test_filter_by_fields(self):
+        # Test column equality filters, alone and combined
+        electronics = self.analyzer.filter_by(category='Electronics')
+        self.assertEqual([s.order_id for s in electronics], [1, 3, 5])
+        north_electronics = self.analyzer.filter_by(category='Electronics', region='North')
+        self.assertEqual([s.product for s in north_electronics], ['Laptop', 'Mouse'])
+        self.assertEqual(len(self.analyzer.filter_by(quantity=5)), 1)
+        self.assertEqual(self.analyzer.filter_by(category='Toys'), [])
+
+    def test_filter_by_derived_date_keys(self):
+        # Test equality filters on the month and weekday keys derived at load
+        self.assertEqual([s.order_id for s in self.analyzer.filter_by(month='2024-02')], [4, 5])
+        self.assertEqual(len(self.analyzer.filter_by(weekday='Thursday')), 2)
+
+    def test_filter_range(self):
+        # Test strict lower and upper bounds on a numeric column
+        self.assertEqual(len(self.analyzer.filter_range('total_price', gt=500)), 2)
+        self.assertEqual(len(self.analyzer.filter_range('total_price', gt=250, lt=1200)), 2)
+        self.assertEqual(len(self.analyzer.filter_range('quantity')), 5)
+
 
 class TestSalesAnalyzerMapping(TestSalesAnalyzerBase):
     # Tests for mapping operations
@@ -173,6 +227,13 @@ class TestSalesAnalyzerMapping(TestSalesAnalyzerBase):
         self.assertEqual(len(products), 5)
         self.assertIn('Laptop', products)
 
+    def test_column_matches_map(self):
+        # Test that column export returns the same values as an attribute mapping
+        for name in ('total_price', 'quantity', 'product', 'order_date'):
+            self.assertEqual(self.analyzer.column(name),
+                             self.analyzer.map_sales(lambda s: getattr(s, name)))
+        self.assertEqual(self.analyzer.column('month'), ['2024-01'] * 3 + ['2024-02'] * 2)
+
 
 class TestSalesAnalyzerStatistics(TestSalesAnalyzerBase):
     # Tests for statistics methods
@@ -223,6 +284,71 @@ class TestSalesAnalyzerQuantity(TestSalesAnalyzerBase):
         self.assertEqual(result['Chair'], 5)
 
 
+class TestSalesAnalyzerCaching(TestSalesAnalyzerBase):
+    # Tests for memoized aggregation results
+
+    def test_repeated_calls_reuse_result(self):
+        # Test that an aggregation is computed once per analyzer
+        self.assertIs(self.analyzer.revenue_by_category(), self.analyzer.revenue_by_category())
+        self.assertIs(self.analyzer.top_customers(2), self.analyzer.top_customers(2))
+
+    def test_cache_keyed_by_arguments(self):
+        # Test that different arguments get separate results
+        self.assertEqual(len(self.analyzer.top_products_by_revenue(2)), 2)
+        self.assertEqual(len(self.analyzer.top_products_by_revenue(4)), 4)
+
+    def test_cached_calls_per_method_bounded(self):
+        # Test that the oldest argument variant is evicted once the per-method limit is reached
+        analyzer = SalesAnalyzer(self.csv_path)
+        first = analyzer.high_value_orders(0.0)
+        self.assertIs(analyzer.high_value_orders(0.0), first)
+        for threshold in range(1, _MAX_CACHED_CALLS + 1):
+            analyzer.high_value_orders(float(threshold))
+        self.assertIsNot(analyzer.high_value_orders(0.0), first)
+        self.assertIs(analyzer.get_statistics(), analyzer.get_statistics())
+
+    def test_precompute_in_workers(self):
+        # Test that results computed in worker processes match and are served from cache
+        analyzer = SalesAnalyzer(self.csv_path)
+        analyzer.precompute(max_workers=2)
+        cached = analyzer.category_breakdown()
+        self.assertIs(analyzer.category_breakdown(), cached)
+        self.assertEqual(cached, self.analyzer.category_breakdown())
+        self.assertEqual(analyzer.monthly_revenue(), self.analyzer.monthly_revenue())
+
+
+class TestSalesAnalyzerEngines(TestSalesAnalyzerBase):
+    # Tests for selecting the CSV parsing backend
+
+    def test_unknown_engine(self):
+        # Test that an unsupported engine name is rejected
+        with self.assertRaises(ValueError):
+            SalesAnalyzer(self.csv_path, engine='pandas')
+
+    @unittest.skipIf(sales_analysis.pa is not None, "pyarrow is installed")
+    def test_pyarrow_engine_requires_pyarrow(self):
+        # Test that the pyarrow engine fails clearly when pyarrow is missing
+        with self.assertRaises(ImportError):
+            SalesAnalyzer(self.csv_path, engine='pyarrow')
+
+    @unittest.skipUnless(sales_analysis.pa is not None, "pyarrow not installed")
+    def test_pyarrow_engine_matches_python(self):
+        # Test that both engines load identical records and aggregations
+        analyzer = SalesAnalyzer(self.csv_path, engine='pyarrow')
+        self.assertEqual(analyzer.map_sales(repr), self.analyzer.map_sales(repr))
+        self.assertEqual(analyzer.column('order_date'), self.analyzer.column('order_date'))
+        self.assertEqual(analyzer.get_statistics(), self.analyzer.get_statistics())
+        self.assertEqual(analyzer.monthly_revenue(), self.analyzer.monthly_revenue())
+
+    def test_from_large_csv_matches_single_pass(self):
+        # Test that chunks parsed in worker processes merge into the same columns
+        analyzer = SalesAnalyzer.from_large_csv(self.csv_path, chunk_bytes=100, max_workers=2)
+        self.assertEqual(analyzer.map_sales(repr), self.analyzer.map_sales(repr))
+        self.assertEqual(analyzer.column('customer_id'), self.analyzer.column('customer_id'))
+        self.assertEqual(analyzer.category_breakdown(), self.analyzer.category_breakdown())
+        self.assertEqual(analyzer.revenue_by_day_of_week(), self.analyzer.revenue_by_day_of_week())
+
+
 class TestSalesAnalyzerEmpty(unittest.TestCase):
     # Tests for edge cases with empty data
 
@@ -233,8 +359,7 @@ class TestSalesAnalyzerEmpty(unittest.TestCase):
 
         with open(csv_path, 'w', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(['Order ID', 'Product', 'Category', 'Quantity', 'Unit Price',
-                           'Total Price', 'Order Date', 'Region', 'Customer ID', 'Payment Method'])
+            writer.writerow(_TEST_DATA[0])
 
         analyzer = SalesAnalyzer(csv_path)
         self.assertEqual(analyzer.average_order_value(), 0.0)
@@ -244,45 +369,33 @@ class TestSalesAnalyzerEmpty(unittest.TestCase):
         os.rmdir(temp_dir)
 
 
+@unittest.skipUnless(_HAS_REAL_DATA, "Real data file not found")
 class TestSalesAnalyzerWithRealData(unittest.TestCase):
     # Tests using the actual sales_data.csv file
 
     @classmethod
     def setUpClass(cls):
-        # Load real data file
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        cls.csv_path = os.path.join(script_dir, 'sales_data.csv')
-        if os.path.exists(cls.csv_path):
-            cls.analyzer = SalesAnalyzer(cls.csv_path)
-            cls.has_real_data = True
-        else:
-            cls.has_real_data = False
+        # Reuse the analyzer loaded once at import
+        cls.csv_path = _REAL_CSV
+        cls.analyzer = _REAL_ANALYZER
 
     def test_real_data_loaded(self):
         # Test that real data file is loaded
-        if not self.has_real_data:
-            self.skipTest("Real data file not found")
         self.assertEqual(len(self.analyzer.data), 50)
 
     def test_real_data_categories(self):
         # Test categories in real data
-        if not self.has_real_data:
-            self.skipTest("Real data file not found")
         categories = self.analyzer.revenue_by_category()
         self.assertIn('Electronics', categories)
         self.assertIn('Furniture', categories)
 
     def test_real_data_regions(self):
         # Test regions in real data
-        if not self.has_real_data:
-            self.skipTest("Real data file not found")
         regions = self.analyzer.revenue_by_region()
         self.assertEqual(len(regions), 4)
 
     def test_real_data_revenue_positive(self):
         # Test that revenue is positive
-        if not self.has_real_data:
-            self.skipTest("Real data file not found")
         self.assertGreater(self.analyzer.total_revenue(), 0)
 
 